@@ -1,110 +1,394 @@
 import re
 import pandas as pd
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import urllib3
+from urllib.parse import urlparse
 import io
 import streamlit as st
-from concurrent.futures import ThreadPoolExecutor
-import difflib as dlb
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from rapidfuzz import process, fuzz, utils
+import ahocorasick
 import fitz  # PyMuPDF
+import xlsxwriter
 import traceback
+import functools
+import logging
+import os
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+FETCH_WORKERS = 64
+
+# Plain-text extraction only: no ligature, whitespace, image or span reconstruction;
+# text outside the page's media box is still clipped away, and glyphs of fonts without
+# a ToUnicode map keep their raw codes (often plain ASCII) instead of becoming U+FFFD
+TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+
+# Expected failures for a single URL or document; anything else is a real bug
+# (raw.read() raises urllib3 errors unwrapped, MuPDF may raise its own base error)
+FETCH_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError)
+PDF_ERRORS = (RuntimeError, ValueError, fitz.mupdf.FzErrorBase)
+
+# One pooled session so repeated hosts reuse their TCP/TLS connections
+SESSION = requests.Session()
+ADAPTER = HTTPAdapter(pool_connections=64, pool_maxsize=FETCH_WORKERS,
+                      max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount('https://', ADAPTER)
+SESSION.mount('http://', ADAPTER)
+
+# PDF bytes are cached per URL for a day; extracted text per SHA-256 of the bytes for
+# a month, under a directory keyed by the extraction settings so a PyMuPDF upgrade or
+# a TEXT_FLAGS change never serves text extracted the old way
+CACHE_DIR = Path('.pdf_cache')
+CACHE_TTL = 86400
+TEXT_CACHE_TTL = 30 * 86400
+TEXT_CACHE_DIR = CACHE_DIR / 'text' / hashlib.sha256(f"{TEXT_FLAGS}:{fitz.VersionBind}".encode()).hexdigest()[:16]
+# Oldest entries are dropped once the whole cache grows past this size
+CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+MAX_STYLED_ROWS = 500
+# Larger result sets are offered as Parquet only
+MAX_EXCEL_ROWS = 50000
+# SIMILARS beyond this many variants is unreadable, so stop collecting there
+MAX_SIMILARS = 32
+
+ILLEGAL_CHARS_RE = re.compile(r'[\x00-\x1F\x7F]')
+
+def clean_column(column):
+    """Remove illegal characters from the string cells of a column; other values pass through unchanged."""
+    is_str = column.map(lambda value: isinstance(value, str))
+    if not is_str.any():
+        return column
+    return column.mask(is_str, column[is_str].str.replace(ILLEGAL_CHARS_RE, '', regex=True))
+
+def part_text(part):
+    """Return a part number cell as text: '' for NaN, '12345' rather than '12345.0' for integral floats."""
+    if pd.isna(part):
+        return ''
+    if isinstance(part, float) and part.is_integer():
+        return str(int(part))
+    return str(part)
+
+@functools.lru_cache(maxsize=4096)
+def compile_part(part):
+    """Compile the semi-regex pattern for a part number once (matches lowercased text)."""
+    return re.compile(r'\b\w*' + re.escape(part.lower()) + r'\w*\b')
+
+def lower_text(text):
+    """Lowercase text without shifting character offsets."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. 'İ') expand when lowercased; keep those as-is
+    return ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+def build_automaton(parts):
+    """Build an Aho-Corasick automaton over the lowercased part numbers."""
+    automaton = ahocorasick.Automaton()
+    for part in parts:
+        if isinstance(part, str) and part:
+            key = part.lower()
+            automaton.add_word(key, key)
+    automaton.make_automaton()
+    return automaton
+
+def scan_text(automaton, text_lc):
+    """Scan lowercased text once and return the first (start, end) offsets of every part found."""
+    hits = {}
+    if len(automaton) == 0:
+        return hits
+    for end, key in automaton.iter(text_lc):
+        if key not in hits:
+            hits[key] = (end - len(key) + 1, end + 1)
+    return hits
+
+def read_cache(path, ttl=None):
+    """Return cached bytes from path, or None if missing or older than ttl seconds."""
+    try:
+        if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+def write_cache(path, content):
+    """Atomically write bytes to a cache file, ignoring cache write failures."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Sessions are threads of one process, so each write needs its own temp file
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{path.name}.", suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_name, path)
+        except OSError:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning("Error writing cache %s: %s", path, e)
+
+def prune_cache():
+    """Delete expired, stale-version and leftover temp cache files, then the oldest past CACHE_MAX_BYTES."""
+    now = time.time()
+    kept = []
+    for path in CACHE_DIR.glob('*/**/*'):
+        try:
+            stat = path.stat()
+            if not path.is_file():
+                continue
+            if path.suffix == '.tmp':
+                expired = now - stat.st_mtime > 3600
+            elif path.parent == TEXT_CACHE_DIR:
+                expired = now - stat.st_mtime > TEXT_CACHE_TTL
+            elif path.parent == CACHE_DIR / 'pdf':
+                expired = now - stat.st_mtime > CACHE_TTL
+            else:
+                # Text extracted with other settings (or an unknown layout) is never read again
+                expired = True
+            if expired:
+                path.unlink()
+            else:
+                kept.append((stat.st_mtime, stat.st_size, path))
+        except OSError as e:
+            logger.warning("Error pruning cache %s: %s", path, e)
+
+    total = sum(size for _, size, _ in kept)
+    for _, size, path in sorted(kept, key=lambda entry: entry[0]):
+        if total <= CACHE_MAX_BYTES:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError as e:
+            logger.warning("Error pruning cache %s: %s", path, e)
 
-def clean_string(s):
-    """Remove illegal characters from a string."""
-    if isinstance(s, str):
-        return re.sub(r'[\x00-\x1F\x7F]', '', s)
-    return s
+def url_host(pdf):
+    """Return the host of a PDF URL, or '' if the cell is not a parseable URL."""
+    try:
+        return urlparse(str(pdf)).netloc
+    except ValueError:
+        # e.g. a stray '[' or ']'; the fetch still runs and reports it as a failed URL
+        return ''
 
 def get_pdf_response(pdf):
-    """Get PDF response from URL and return content."""
+    """Get PDF response from URL (or the on-disk cache) and return content."""
+    cache_path = CACHE_DIR / 'pdf' / hashlib.sha256(str(pdf).encode()).hexdigest()
+    cached = read_cache(cache_path, ttl=CACHE_TTL)
+    if cached is not None:
+        return pdf, cached
+
+    try:
+        with SESSION.get(pdf, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            # Read the body in one call instead of joining requests' 10 KB chunks
+            content = response.raw.read(decode_content=True)
+        # Only cache real PDFs, not HTML error or login pages served with a 200
+        if b'%PDF' in content[:1024]:
+            write_cache(cache_path, content)
+        return pdf, content
+    except FETCH_ERRORS as e:
+        logger.warning("Error fetching PDF %s: %s", pdf, e)
+        return pdf, None
+
+def init_pdf_worker():
+    """Configure PyMuPDF once per parse worker process."""
+    # Broken PDFs are reported through exceptions; keep MuPDF's own stderr chatter quiet
+    fitz.TOOLS.mupdf_display_errors(False)
+    fitz.TOOLS.mupdf_display_warnings(False)
+
+def extract_pdf_text(download):
+    """Extract the text of a downloaded PDF given as a (url, bytes) pair."""
+    pdf, content = download
     try:
-        response = requests.get(pdf, timeout=10)
-        response.raise_for_status()
-        return pdf, io.BytesIO(response.content)
-    except Exception as e:
-        print(f"Error fetching PDF {pdf}: {e}")
+        with fitz.open(stream=content, filetype='pdf') as doc:
+            return pdf, '\n'.join(page.get_text('text', flags=TEXT_FLAGS, sort=False) for page in doc)
+    except PDF_ERRORS as e:
+        logger.warning("Error reading PDF %s: %s", pdf, e)
         return pdf, None
 
+# Not memoized with st.cache_data: that cache is shared by every session and would pin
+# failed fetches as "May be Broken". Reruns (e.g. a download click) are served by the
+# on-disk byte and text caches instead, which only ever hold successful results
 def get_pdf_text(pdfs):
     """Extract text from a list of PDF URLs."""
     pdf_data = {}
-    chunks = [pdfs[i:i + 100] for i in range(0, len(pdfs), 100)]
-
-    for chunk in chunks:
-        with ThreadPoolExecutor() as executor:
-            results = list(executor.map(get_pdf_response, chunk))
-
-        for pdf, byt in results:
-            if byt is not None:
-                try:
-                    with fitz.open(stream=byt, filetype='pdf') as doc:
-                        pdf_data[pdf] = '\n'.join(page.get_text() for page in doc)
-                except Exception as e:
-                    print(f"Error reading PDF {pdf}: {e}")
-
-    return pdf_data
+    # Many rows share a datasheet; fetch and parse each URL only once
+    unique_pdfs = list(dict.fromkeys(pdfs))
+    if len(unique_pdfs) < len(pdfs):
+        logger.info("Fetching %d unique PDFs for %d rows", len(unique_pdfs), len(pdfs))
+        st.caption(f"Fetching {len(unique_pdfs)} unique PDFs for {len(pdfs)} rows")
+    # Group URLs by host so consecutive requests hit warm pooled connections
+    pdfs = sorted(unique_pdfs, key=url_host)
+    prune_cache()
+
+    # Downloads run on FETCH_WORKERS threads; parsing is CPU-bound and holds the GIL,
+    # so it runs on one process per core and starts as soon as each download lands
+    urls_by_digest = {}
+    texts_by_digest = {}
+    parses = {}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor, \
+            ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_pdf_worker) as pool:
+        for fetch in as_completed([executor.submit(get_pdf_response, pdf) for pdf in pdfs]):
+            pdf, content = fetch.result()
+            if content is None:
+                continue
+
+            # Byte-identical PDFs (same datasheet under several URLs) are parsed once,
+            # and their text is cached on disk by the same content hash
+            digest = hashlib.sha256(content).hexdigest()
+            if digest in urls_by_digest:
+                urls_by_digest[digest].append(pdf)
+                continue
+            urls_by_digest[digest] = [pdf]
+
+            cached = read_cache(TEXT_CACHE_DIR / digest, ttl=TEXT_CACHE_TTL)
+            if cached is not None:
+                texts_by_digest[digest] = cached.decode('utf-8', 'surrogatepass')
+            else:
+                parses[pool.submit(extract_pdf_text, (pdf, content))] = digest
+
+        for parse in as_completed(parses):
+            _, text = parse.result()
+            if text is not None:
+                texts_by_digest[parses[parse]] = text
+                write_cache(TEXT_CACHE_DIR / parses[parse], text.encode('utf-8', 'surrogatepass'))
+
+    for digest, text in texts_by_digest.items():
+        for pdf in urls_by_digest[digest]:
+            pdf_data[pdf] = text
+
+    # Completion order is arbitrary; return the texts in the order the URLs were given
+    return {pdf: pdf_data[pdf] for pdf in unique_pdfs if pdf in pdf_data}
+
+def validate_pdf_rows(task):
+    """Validate every (row position, part) pair that shares one PDF text."""
+    values, rows = task
+    # Lowercase once; offsets still index into the original text
+    text_lc = lower_text(values)
+    # One Aho-Corasick pass finds every part of this PDF it contains
+    hits = scan_text(build_automaton({part for _, part in rows}), text_lc)
+    tokens = None
+
+    results = {}
+    for i, part in rows:
+        exact = hits.get(part.lower())
+        if exact:
+            start, end = exact
+            semi_regex = set()
+            for match in compile_part(part).finditer(text_lc):
+                semi_regex.add(values[match.start():match.end()].strip())
+                if len(semi_regex) >= MAX_SIMILARS:
+                    break
+            results[i] = ('Exact', values[start:end], '|'.join(semi_regex) if semi_regex else None)
+            continue
+
+        # Tokenize only when a row falls through to the fuzzy fallback
+        if tokens is None:
+            # dict.fromkeys keeps tokens unique but in text order, so ties resolve the same way every run
+            tokens = [token for token in dict.fromkeys(re.split(r'[ \n]', values)) if token]
+        fuzzy_match = process.extractOne(part, tokens, scorer=fuzz.ratio,
+                                         processor=utils.default_process, score_cutoff=65)
+        if fuzzy_match:
+            results[i] = ('Includes or Missed Suffixes', fuzzy_match[0], None)
+        else:
+            results[i] = ('Not Found', None, None)
+
+    return results
 
 def pn_validation(pdf_data, part_col, pdf_col, data):
     """Validate parts against extracted PDF data."""
-    data['STATUS'] = None
-    data['EQUIVALENT'] = None
-    data['SIMILARS'] = None
-
-    def set_desc(index):
-        part = data[part_col][index]
-        pdf_url = data[pdf_col][index]
-        if pdf_url not in pdf_data:
-            data['STATUS'][index] = 'May be Broken'
-            return
-
-        values = pdf_data[pdf_url]
-        if len(values) <= 100:
-            data['STATUS'][index] = 'OCR'
-            return
-
-        exact = re.search(re.escape(part), values, flags=re.IGNORECASE)
-        if exact:
-            data['STATUS'][index] = 'Exact'
-            data['EQUIVALENT'][index] = exact.group(0)
-            semi_regex = {
-                match.strip() for match in re.findall(r'\b\w*' + re.escape(part) + r'\w*\b', values, flags=re.IGNORECASE)
-            }
-            if semi_regex:
-                data['SIMILARS'][index] = '|'.join(semi_regex)
-            return
-
-        dlb_match = dlb.get_close_matches(part, re.split('[ \n]', values), n=1, cutoff=0.65)
-        if dlb_match:
-            pdf_part = dlb_match[0]
-            data['STATUS'][index] = 'Includes or Missed Suffixes'
-            data['EQUIVALENT'][index] = pdf_part
-            return
-
-        data['STATUS'][index] = 'Not Found'
-
-    with ThreadPoolExecutor() as executor:
-        executor.map(set_desc, data.index)
+    parts = [part_text(part) for part in data[part_col].to_numpy()]
+
+    # Short texts are scanned images (OCR); drop them once so no search touches them
+    pdf_text_ok = {url: values for url, values in pdf_data.items() if len(values) > 100}
+    ocr_urls = pdf_data.keys() - pdf_text_ok.keys()
+
+    # Results go into preallocated arrays and are assigned as whole columns
+    status = np.empty(len(data), dtype=object)
+    equivalent = np.empty(len(data), dtype=object)
+    similars = np.empty(len(data), dtype=object)
+
+    # Group row positions by PDF so each text is scanned once for all of its parts
+    rows_by_url = {}
+    for i, (part, pdf_url) in enumerate(zip(parts, data[pdf_col].to_numpy())):
+        if pdf_url in ocr_urls:
+            status[i] = 'OCR'
+        elif pdf_url not in pdf_text_ok:
+            status[i] = 'May be Broken'
+        else:
+            rows_by_url.setdefault(pdf_url, []).append((i, part))
+
+    # Each PDF is an independent CPU-bound task, so PDFs are spread over processes
+    tasks = [(pdf_text_ok[url], rows) for url, rows in rows_by_url.items()]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for results in pool.map(validate_pdf_rows, tasks):
+            for i, (row_status, row_equivalent, row_similars) in results.items():
+                status[i] = row_status
+                equivalent[i] = row_equivalent
+                similars[i] = row_similars
+
+    data['STATUS'] = status
+    data['EQUIVALENT'] = equivalent
+    data['SIMILARS'] = similars
 
     return data
 
+# Set once per search worker process by init_search_worker
+search_automaton = None
+
+def init_search_worker(mpns):
+    """Build the MPN automaton once per search worker process."""
+    global search_automaton
+    search_automaton = build_automaton(mpns)
+
+def find_mpns_in_text(content):
+    """Return the lowercased MPNs found in one PDF text."""
+    return list(scan_text(search_automaton, lower_text(content)))
+
 def search_mpns_in_pdfs(mpns, pdf_data):
     """Search for MPNs in provided PDFs and return matches."""
+    mpns = [part_text(mpn) for mpn in mpns if pd.notna(mpn)]
+
+    # Inverted index: one Aho-Corasick pass per PDF lists every MPN it contains;
+    # each pass is independent and CPU-bound, so PDFs are spread over processes
+    urls_by_mpn = {}
+    if pdf_data:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_search_worker,
+                                 initargs=(mpns,)) as pool:
+            for pdf_url, found in zip(pdf_data, pool.map(find_mpns_in_text, pdf_data.values())):
+                for mpn_lc in found:
+                    urls_by_mpn.setdefault(mpn_lc, []).append(pdf_url)
+
     found_pdfs = []
-    
     for mpn in mpns:
-        for pdf_url, content in pdf_data.items():
-            if re.search(re.escape(mpn), content, flags=re.IGNORECASE):
-                found_pdfs.append({"MPN": mpn, "PDF_URL": pdf_url})
-    
-    return found_pdfs
+        for pdf_url in urls_by_mpn.get(mpn.lower(), []):
+            found_pdfs.append({"MPN": mpn, "PDF_URL": pdf_url})
 
-def save_to_excel(data, filename):
-    """Save results to a formatted Excel file."""
-    with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
-        data.to_excel(writer, sheet_name='Results', index=False)
+    return found_pdfs
 
-        # Get the xlsxwriter workbook and worksheet objects
-        workbook = writer.book
-        worksheet = writer.sheets['Results']
+def save_to_parquet(data, output):
+    """Save results to a zstd-compressed Parquet file (path or buffer)."""
+    # Mixed-type object columns from uploaded sheets are stored as text
+    object_cols = data.select_dtypes(include='object').columns
+    data.astype({col: 'string' for col in object_cols}).to_parquet(
+        output, engine='pyarrow', compression='zstd', index=False)
+
+def save_to_excel(data, output):
+    """Save results to a formatted Excel file (path or buffer)."""
+    # constant_memory flushes each row as soon as the next one starts instead of
+    # holding the whole sheet in memory, so the sheet is formatted first and the
+    # cells are written strictly row by row (pandas to_excel writes column-wise)
+    options = {'constant_memory': True, 'nan_inf_to_errors': True,
+               'default_date_format': 'yyyy-mm-dd hh:mm:ss', 'remove_timezone': True}
+    with xlsxwriter.Workbook(output, options) as workbook:
+        worksheet = workbook.add_worksheet('Results')
 
         # Format approaches
         format1 = workbook.add_format({'bold': True, 'font_color': 'blue'})
@@ -130,6 +414,28 @@ def save_to_excel(data, filename):
                                                     'value': 'Exact',
                                                     'format': format3})
 
+        worksheet.write_row(0, 0, [str(col) for col in data.columns], format1)
+        rows = data.astype(object).where(data.notna(), None)
+        for row_num, row in enumerate(rows.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_num, 0, row)
+
+def status_styles(view, status_color):
+    """Build the CSS for every cell at once, coloring each row by its STATUS."""
+    css = ('color: ' + view['STATUS'].map(status_color).fillna('black')).to_numpy()
+    return pd.DataFrame(np.repeat(css[:, None], view.shape[1], axis=1),
+                        index=view.index, columns=view.columns)
+
+def offer_downloads(data, name, label):
+    """Add sidebar download buttons for Parquet and, below MAX_EXCEL_ROWS, Excel."""
+    parquet_buffer = io.BytesIO()
+    save_to_parquet(data, parquet_buffer)
+    st.sidebar.download_button(f"{label} (Parquet) 📥", data=parquet_buffer.getvalue(), file_name=f"{name}.parquet")
+
+    if len(data) < MAX_EXCEL_ROWS:
+        excel_buffer = io.BytesIO()
+        save_to_excel(data, excel_buffer)
+        st.sidebar.download_button(f"{label} 📥", data=excel_buffer.getvalue(), file_name=f"{name}.xlsx")
+
 def main():
     st.title("MPN PDF Validation App 🛠️")
 
@@ -139,7 +445,7 @@ def main():
     
     if uploaded_file is not None:
         try:
-            data = pd.read_excel(uploaded_file)
+            data = pd.read_excel(uploaded_file, engine='calamine')
             st.write("### Uploaded Data:")
             st.dataframe(data)
 
@@ -150,7 +456,7 @@ def main():
 
                 # Clean the output data
                 for col in ['MPN', 'PDF', 'STATUS', 'EQUIVALENT', 'SIMILARS']:
-                    result_data[col] = result_data[col].apply(clean_string)
+                    result_data[col] = clean_column(result_data[col])
 
                 # Display validation results
                 st.subheader("Validation Results")
@@ -161,14 +467,15 @@ def main():
                     'May be Broken': 'gray'
                 }
 
-                for index, row in result_data.iterrows():
-                    color = STATUS_color.get(row['STATUS'], 'black')
-                    st.markdown(f"<div style='color: {color};'>{row['MPN']} - {row['STATUS']} - {row['EQUIVALENT']} - {row['SIMILARS']}</div>", unsafe_allow_html=True)
+                # One styled table instead of one markdown element per row; past
+                # MAX_STYLED_ROWS the plain grid is shown since styling cost grows per cell
+                results_view = result_data[['MPN', 'STATUS', 'EQUIVALENT', 'SIMILARS']]
+                if len(results_view) <= MAX_STYLED_ROWS:
+                    results_view = results_view.style.apply(status_styles, axis=None, status_color=STATUS_color)
+                st.dataframe(results_view, width='stretch')
 
-                # Save results to an Excel file with formatting
-                output_file = "MPN_Validation_Result.xlsx"
-                save_to_excel(result_data, output_file)
-                st.sidebar.download_button("Download Results 📥", data=open(output_file, "rb"), file_name=output_file)
+                # Serve downloads from memory: Parquet always, formatted Excel while it stays practical
+                offer_downloads(result_data, "MPN_Validation_Result", "Download Results")
 
             else:
                 st.error("The uploaded file must contain 'MPN' and 'PDF' columns.")
@@ -200,8 +507,8 @@ def main():
     st.markdown(footer, unsafe_allow_html=True)
     if uploaded_mpn_file is not None and uploaded_pdf_file is not None:
         try:
-            mpn_data = pd.read_excel(uploaded_mpn_file)
-            pdf_data_frame = pd.read_excel(uploaded_pdf_file)
+            mpn_data = pd.read_excel(uploaded_mpn_file, engine='calamine')
+            pdf_data_frame = pd.read_excel(uploaded_pdf_file, engine='calamine')
 
             st.write("### Uploaded MPN Data:")
             st.dataframe(mpn_data)
@@ -225,10 +532,8 @@ def main():
                     found_df = pd.DataFrame(found_pdfs)
                     st.write(found_df)
 
-                    # Save found results to an Excel file
-                    output_found_file = "Found_PDFs.xlsx"
-                    save_to_excel(found_df, output_found_file)
-                    st.sidebar.download_button("Download Found PDFs 📥", data=open(output_found_file, "rb"), file_name=output_found_file)
+                    # Serve found results from memory
+                    offer_downloads(found_df, "Found_PDFs", "Download Found PDFs")
                 else:
                     st.write("No PDFs found containing the provided MPNs.")
             else: